@@ -5,38 +5,121 @@ y descargar documentos PDF referenciados.
 """
 
 import os
+import re
 import sys
+import shutil
+import threading
 import zipfile
 import requests
-import xml.etree.ElementTree as ET
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 from urllib.parse import urlparse, urljoin
 from pathlib import Path
 import argparse
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import time
 
 # Configurar logging
 logging.basicConfig(
-    level=logging.DEBUG,  # Cambiado a DEBUG para más información
+    level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Etiquetas Atom cualificadas con su namespace
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+Q_ENTRY = f'{{{ATOM_NS}}}entry'
+
+# Máximo de entradas listadas al inspeccionar un archivo
+INSPECT_MAX_ENTRIES = 50
+
+# Reintentos de una descarga rechazada con HTTP 429 (Too Many Requests)
+RATE_LIMIT_RETRIES = 3
+
+# Extractor de cada proceso del pool de parseo
+_worker_extractor = None
+
+
+def _init_worker(download_dir: str) -> None:
+    """Crear el extractor de un proceso del pool."""
+    global _worker_extractor
+    _worker_extractor = AtomExtractor(download_dir=download_dir)
+
+
+def _parse_member(zip_path: str, member: str) -> List[Dict]:
+    """Parsear un archivo .atom del ZIP en un proceso del pool."""
+    return _worker_extractor.parse_zip_member(zip_path, member)
+
+
+class TokenBucket:
+    """
+    Limitador de peticiones por segundo compartido entre hilos.
+    
+    La tasa se adapta a las respuestas del servidor: se reduce a la mitad
+    cuando rechaza peticiones y vuelve a crecer poco a poco hasta la tasa
+    configurada mientras las acepta.
+    """
+    
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Inicializar el limitador.
+        
+        Args:
+            rate: Peticiones por segundo máximas
+            capacity: Ráfaga máxima de peticiones (default: el doble de rate)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = min(rate, 0.1)
+        self.capacity = capacity if capacity is not None else max(1.0, rate * 2)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        
+    def consume(self, tokens: float = 1.0) -> None:
+        """Esperar hasta disponer de tokens suficientes y consumirlos."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            
+    def decrease(self) -> None:
+        """Reducir la tasa a la mitad tras un rechazo del servidor."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            self._tokens = min(self._tokens, 0.0)
+            
+    def increase(self) -> None:
+        """Aumentar la tasa gradualmente tras una respuesta correcta."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.1)
+
+
 class AtomExtractor:
-    def __init__(self, download_dir: str = "downloaded_docs"):
+    def __init__(self, download_dir: str = "downloaded_docs", rps: float = 5.0):
         """
         Inicializar el extractor.
         
         Args:
             download_dir: Directorio donde guardar los documentos descargados
+            rps: Peticiones por segundo máximas al descargar documentos
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(exist_ok=True)
         
         # Namespaces basados en la muestra real
         self.namespaces = {
-            'atom': 'http://www.w3.org/2005/Atom',
+            'atom': ATOM_NS,
             'cac': 'urn:dgpe:names:draft:codice:schema:xsd:CommonAggregateComponents-2',
             'cbc': 'urn:dgpe:names:draft:codice:schema:xsd:CommonBasicComponents-2',
             'cac-place-ext': 'urn:dgpe:names:draft:codice-place-ext:schema:xsd:CommonAggregateComponents-2',
@@ -45,10 +128,55 @@ class AtomExtractor:
             'ns7': 'urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2'
         }
         
+        self._compile_xpaths()
+        
+        # Opciones del parser XML: descartar los nodos de texto vacíos y no
+        # resolver entidades ni indexar IDs, que este esquema no necesita
+        self._parser_options = {
+            'remove_blank_text': True,
+            'resolve_entities': False,
+            'collect_ids': False,
+            'huge_tree': True,
+        }
+        self._parser = etree.XMLParser(**self._parser_options)
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Reutilizar conexiones entre las descargas concurrentes y reintentar errores del servidor
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._download_lock = threading.Lock()
+        self._used_names = set()
+        self.limiter = TokenBucket(rate=rps)
+
+    def _compile_xpaths(self):
+        """Precompilar las expresiones XPath, reutilizadas en todas las entradas."""
+        ns = self.namespaces
+        self._xp_id = etree.XPath('string(atom:id)', namespaces=ns)
+        self._xp_title = etree.XPath('string(atom:title)', namespaces=ns)
+        self._xp_summary = etree.XPath('string(atom:summary)', namespaces=ns)
+        self._xp_updated = etree.XPath('string(atom:updated)', namespaces=ns)
+        self._xp_link_href = etree.XPath('string(atom:link/@href)', namespaces=ns)
+        self._xp_link_text = etree.XPath('string(atom:link)', namespaces=ns)
+        # Un único descenso hasta TechnicalDocumentReference; el resto son pasos a hijos directos
+        self._xp_tech_uri = etree.XPath(
+            'string(.//cac:TechnicalDocumentReference/cac:Attachment/cac:ExternalReference/cbc:URI)',
+            namespaces=ns
+        )
+        # Etiquetas para recoger nombres y códigos en un único recorrido de la entrada
+        cac = '{%s}' % ns['cac']
+        cbc = '{%s}' % ns['cbc']
+        self._q_party_name = cac + 'PartyName'
+        self._q_commodity = cac + 'RequiredCommodityClassification'
+        self._q_name = cbc + 'Name'
+        self._q_code = cbc + 'ItemClassificationCode'
 
     def download_zip(self, url: str, local_path: str = "temp.zip") -> str:
         """
@@ -61,21 +189,21 @@ class AtomExtractor:
         Returns:
             Ruta del archivo descargado
         """
-        logger.info(f"Descargando ZIP desde: {url}")
+        logger.info("Descargando ZIP desde: %s", url)
         
         try:
             response = self.session.get(url, stream=True)
             response.raise_for_status()
+            response.raw.decode_content = True
             
             with open(local_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
                     
-            logger.info(f"ZIP descargado exitosamente: {local_path}")
+            logger.info("ZIP descargado exitosamente: %s", local_path)
             return local_path
             
         except requests.RequestException as e:
-            logger.error(f"Error descargando ZIP: {e}")
+            logger.error("Error descargando ZIP: %s", e)
             raise
 
     def extract_zip(self, zip_path: str, extract_dir: str = "temp_extract") -> str:
@@ -92,14 +220,49 @@ class AtomExtractor:
         extract_path = Path(extract_dir)
         extract_path.mkdir(exist_ok=True)
         
-        logger.info(f"Extrayendo ZIP: {zip_path}")
+        logger.info("Extrayendo ZIP: %s", zip_path)
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
+        self._extract_members(zip_path, extract_path)
             
-        logger.info(f"ZIP extraído en: {extract_path}")
+        logger.info("ZIP extraído en: %s", extract_path)
         return str(extract_path)
 
+    def _extract_members(self, zip_path: str, extract_path: Path) -> None:
+        """
+        Extraer los miembros del ZIP en paralelo con un pool de hilos
+        (zlib libera el GIL mientras descomprime).
+        
+        Args:
+            zip_path: Ruta del archivo ZIP
+            extract_path: Directorio donde extraer
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            infos = zip_ref.infolist()
+            
+        # Cada hilo abre su propio manejador del ZIP
+        local = threading.local()
+        handles = []
+        
+        def extract_member(info):
+            zip_ref = getattr(local, 'zip_ref', None)
+            if zip_ref is None:
+                zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+                handles.append(zip_ref)
+            try:
+                return zip_ref.extract(info, extract_path)
+            except FileExistsError:
+                # Otro hilo ha creado el mismo directorio a la vez
+                return zip_ref.extract(info, extract_path)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # Consumir los resultados para propagar cualquier error de extracción
+                for _ in executor.map(extract_member, infos):
+                    pass
+        finally:
+            for zip_ref in handles:
+                zip_ref.close()
+
     def find_atom_files(self, directory: str) -> List[str]:
         """
         Buscar archivos .atom en el directorio extraído.
@@ -110,13 +273,9 @@ class AtomExtractor:
         Returns:
             Lista de rutas de archivos .atom
         """
-        atom_files = []
-        for root, dirs, files in os.walk(directory):
-            for file in files:
-                if file.endswith('.atom'):
-                    atom_files.append(os.path.join(root, file))
-                    
-        logger.info(f"Encontrados {len(atom_files)} archivos .atom")
+        atom_files = [str(path) for path in Path(directory).rglob('*.atom')]
+        
+        logger.info("Encontrados %s archivos .atom", len(atom_files))
         return atom_files
 
     def parse_atom_file(self, file_path: str) -> List[Dict]:
@@ -129,243 +288,183 @@ class AtomExtractor:
         Returns:
             Lista de diccionarios con los datos extraídos
         """
-        logger.info(f"Procesando archivo ATOM: {file_path}")
+        logger.info("Procesando archivo ATOM: %s", file_path)
+        return self._parse_atom_stream(file_path, file_path)
+
+    def parse_zip_member(self, zip_path: str, member: str) -> List[Dict]:
+        """
+        Parsear un archivo ATOM leyéndolo directamente del ZIP, sin extraerlo a disco.
         
+        Args:
+            zip_path: Ruta del archivo ZIP
+            member: Nombre del archivo .atom dentro del ZIP
+            
+        Returns:
+            Lista de diccionarios con los datos extraídos
+        """
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                return self._parse_open_member(zip_ref, member)
+        except (OSError, zipfile.BadZipFile) as e:
+            logger.error("Error leyendo %s de %s: %s", member, zip_path, e)
+            return []
+
+    def _parse_open_member(self, zip_ref: zipfile.ZipFile, member: str) -> List[Dict]:
+        """
+        Parsear un archivo ATOM de un ZIP ya abierto.
+        
+        Args:
+            zip_ref: ZIP abierto
+            member: Nombre del archivo .atom dentro del ZIP
             
-            # Debug: mostrar información del archivo
-            logger.debug(f"Root tag: {root.tag}")
-            logger.debug(f"Root namespace: {root.nsmap if hasattr(root, 'nsmap') else 'No nsmap available'}")
-            
-            # Auto-detectar namespaces del archivo usando ElementTree
-            detected_namespaces = {}
-            # Extraer namespaces del root tag si están presentes
-            for elem in root.iter():
-                if elem.tag.startswith('{'):
-                    # Extraer URI del namespace
-                    uri = elem.tag[1:elem.tag.find('}')]
-                    tag_name = elem.tag[elem.tag.find('}')+1:]
-                    # Intentar mapear a prefijos conocidos
-                    if 'atom' in uri:
-                        detected_namespaces['atom'] = uri
-                    elif 'CommonAggregateComponents' in uri:
-                        detected_namespaces['cac'] = uri
-                    elif 'CommonBasicComponents' in uri:
-                        detected_namespaces['cbc'] = uri
-                    elif 'PlaceExtensions' in uri:
-                        if 'cac-place-ext' not in detected_namespaces:
-                            detected_namespaces['cac-place-ext'] = uri
-                        if 'cbc-place-ext' not in detected_namespaces:
-                            detected_namespaces['cbc-place-ext'] = uri
-                            
-            # Combinar namespaces detectados con los predefinidos
-            all_namespaces = {**self.namespaces, **detected_namespaces}
-            logger.debug(f"Namespaces detectados: {detected_namespaces}")
+        Returns:
+            Lista de diccionarios con los datos extraídos
+        """
+        logger.info("Procesando archivo ATOM: %s", member)
+        try:
+            with zip_ref.open(member) as atom_file:
+                return self._parse_atom_stream(atom_file, member)
+        except (OSError, zipfile.BadZipFile) as e:
+            logger.error("Error leyendo %s de %s: %s", member, zip_ref.filename, e)
+            return []
+
+    def _parse_atom_stream(self, source, name: str) -> List[Dict]:
+        """
+        Extraer las entradas de un documento ATOM recorriéndolo en streaming.
+        
+        Args:
+            source: Ruta o archivo abierto con el documento ATOM
+            name: Nombre del documento para los mensajes de log
             
+        Returns:
+            Lista de diccionarios con los datos extraídos
+        """
+        try:
             entries = []
+            entry_count = 0
             
-            # Buscar todas las entradas - múltiples enfoques
-            entry_elements = []
-            
-            # Primero registrar el namespace por defecto si es necesario
-            if root.tag.startswith('{http://www.w3.org/2005/Atom}'):
-                # El namespace atom es el por defecto, registrar como tal
-                all_namespaces[''] = 'http://www.w3.org/2005/Atom'
-            
-            # Intentar diferentes formas de encontrar entries
-            searches = [
-                ('entry', 'Sin namespace - directo bajo feed'),
-                ('.//entry', 'Sin namespace - recursivo'),
-                ('{http://www.w3.org/2005/Atom}entry', 'Con namespace completo directo'),
-                ('.//{http://www.w3.org/2005/Atom}entry', 'Con namespace completo recursivo'),
-            ]
-            
-            for search_pattern, description in searches:
-                try:
-                    found = root.findall(search_pattern)
-                    
-                    if found:
-                        logger.info(f"Encontradas {len(found)} entradas usando: {description}")
-                        entry_elements = found
-                        break
-                    else:
-                        logger.debug(f"No se encontraron entradas con: {description}")
-                except Exception as e:
-                    logger.debug(f"Error buscando con {description}: {e}")
-            
-            # Si aún no encontramos, buscar en toda la estructura de forma recursiva
-            if not entry_elements:
-                logger.debug("Buscando elementos 'entry' de forma recursiva...")
-                for elem in root.iter():
-                    # Extraer solo el nombre del tag sin namespace
-                    tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                    if tag_name == 'entry':
-                        logger.debug(f"Entry encontrado: {elem.tag}")
-                        entry_elements.append(elem)
-            
-            if not entry_elements:
-                logger.warning("No se encontraron elementos <entry> en el archivo")
-                # Debug: mostrar algunos elementos del archivo
-                logger.debug("Primeros 10 elementos en el archivo:")
-                for i, elem in enumerate(root.iter()):
-                    if i >= 10:
-                        break
-                    logger.debug(f"  {elem.tag}")
-                return []
+            # Recorrer el archivo en streaming, liberando cada entrada una vez procesada
+            for _, entry in etree.iterparse(source, tag=Q_ENTRY, **self._parser_options):
+                if entry_count == 0:
+                    self._update_namespaces(entry.nsmap)
+                entry_count += 1
                 
-            logger.info(f"Procesando {len(entry_elements)} entradas encontradas")
-            
-            for entry in entry_elements:
-                entry_data = self.extract_entry_data(entry, all_namespaces)
+                entry_data = self.extract_entry_data(entry)
                 if entry_data:
                     entries.append(entry_data)
                     
-            logger.info(f"Extraídas {len(entries)} entradas válidas del archivo")
+                entry.clear()
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
+            
+            if not entry_count:
+                logger.warning("No se encontraron elementos <entry> en el archivo")
+                return []
+                
+            logger.info("Extraídas %s entradas válidas de %s encontradas", len(entries), entry_count)
             return entries
             
-        except ET.ParseError as e:
-            logger.error(f"Error parseando XML en {file_path}: {e}")
+        except etree.XMLSyntaxError as e:
+            logger.error("Error parseando XML en %s: %s", name, e)
             return []
         except Exception as e:
-            logger.error(f"Error procesando {file_path}: {e}")
+            logger.error("Error procesando %s: %s", name, e)
             return []
 
-    def extract_entry_data(self, entry, namespaces: Dict = None) -> Optional[Dict]:
+    def parse_zip_atom_files(self, zip_path: str, workers: int = 1) -> Iterator[List[Dict]]:
+        """
+        Parsear los archivos ATOM del ZIP sin extraerlos, en paralelo si se
+        indica más de un proceso.
+        
+        Args:
+            zip_path: Ruta del archivo ZIP
+            workers: Número de procesos a usar para el parseo
+            
+        Returns:
+            Iterador con las entradas de cada archivo, en el orden del ZIP
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            members = [info.filename for info in zip_ref.infolist() if info.filename.endswith('.atom')]
+            
+        logger.info("Encontrados %s archivos .atom en el ZIP", len(members))
+        
+        if workers <= 1 or len(members) <= 1:
+            # En serie basta con abrir el ZIP una vez para todos los archivos
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                for member in members:
+                    yield self._parse_open_member(zip_ref, member)
+            return
+            
+        logger.info("Parseando archivos .atom con %s procesos", workers)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(str(self.download_dir),)) as executor:
+            yield from executor.map(_parse_member, [zip_path] * len(members), members, chunksize=4)
+
+    def _update_namespaces(self, nsmap: Dict) -> None:
+        """
+        Ajustar los namespaces a los declarados en el archivo.
+        
+        Args:
+            nsmap: Namespaces en ámbito (el namespace por defecto es el de Atom)
+        """
+        detected_namespaces = {prefix or 'atom': uri for prefix, uri in nsmap.items()}
+        logger.debug("Namespaces detectados: %s", detected_namespaces)
+        
+        # Recompilar las expresiones solo si el archivo asocia un prefijo conocido a otra URI
+        changed = {prefix: uri for prefix, uri in detected_namespaces.items()
+                   if prefix in self.namespaces and self.namespaces[prefix] != uri}
+        if changed:
+            logger.debug("Actualizando namespaces: %s", changed)
+            self.namespaces.update(changed)
+            self._compile_xpaths()
+
+    def extract_entry_data(self, entry) -> Optional[Dict]:
         """
         Extraer datos específicos de una entrada ATOM.
         
         Args:
             entry: Elemento XML de la entrada
-            namespaces: Diccionario de namespaces a usar
             
         Returns:
             Diccionario con los datos extraídos
         """
-        if namespaces is None:
-            namespaces = self.namespaces
-            
         data = {}
         
-        # Función auxiliar para buscar elementos con namespace por defecto
-        def find_element(parent, tag_name):
-            # Primero intentar sin namespace
-            element = parent.find(tag_name)
-            if element is not None:
-                return element
-            
-            # Intentar con namespace de Atom explícito
-            element = parent.find(f'{{http://www.w3.org/2005/Atom}}{tag_name}')
-            if element is not None:
-                return element
-                
-            # Intentar búsqueda recursiva
-            for elem in parent.iter():
-                if elem.tag.endswith(f'}}{tag_name}') or elem.tag == tag_name:
-                    return elem
-            return None
+        # Extraer campos básicos de ATOM directamente como texto, sin crear elementos
+        data['id'] = self._xp_id(entry).strip() or None
+        data['title'] = self._xp_title(entry).strip() or None
+        data['summary'] = self._xp_summary(entry).strip() or None
+        data['updated'] = self._xp_updated(entry).strip() or None
         
-        # Extraer campos básicos de ATOM
-        data['id'] = self._get_text(find_element(entry, 'id'))
-        data['title'] = self._get_text(find_element(entry, 'title'))
-        data['summary'] = self._get_text(find_element(entry, 'summary'))
-        data['updated'] = self._get_text(find_element(entry, 'updated'))
-        
-        # Extraer link - puede tener atributo href
-        link_element = find_element(entry, 'link')
-        if link_element is not None:
-            # Primero intentar atributo href
-            data['link'] = link_element.get('href')
-            # Si no hay href, usar el texto del elemento
-            if not data['link']:
-                data['link'] = self._get_text(link_element)
-        else:
-            data['link'] = None
-            
-        # Buscar TechnicalDocumentReference en la estructura real
-        # Basado en la muestra, está dentro de cac-place-ext:ContractFolderStatus
-        contract_status = entry.find('.//cac-place-ext:ContractFolderStatus', namespaces)
-        if contract_status is None:
-            # Intentar sin namespace
-            contract_status = entry.find('.//ContractFolderStatus')
-            
-        if contract_status is not None:
-            tech_doc_ref = contract_status.find('.//cac:TechnicalDocumentReference', namespaces)
-            if tech_doc_ref is None:
-                tech_doc_ref = contract_status.find('.//TechnicalDocumentReference')
-                
-            if tech_doc_ref is not None:
-                attachment = tech_doc_ref.find('.//cac:Attachment', namespaces)
-                if attachment is None:
-                    attachment = tech_doc_ref.find('.//Attachment')
-                    
-                if attachment is not None:
-                    external_ref = attachment.find('.//cac:ExternalReference', namespaces)
-                    if external_ref is None:
-                        external_ref = attachment.find('.//ExternalReference')
-                        
-                    if external_ref is not None:
-                        uri_element = external_ref.find('.//cbc:URI', namespaces)
-                        if uri_element is None:
-                            uri_element = external_ref.find('.//URI')
-                            
-                        if uri_element is not None:
-                            data['document_uri'] = self._get_text(uri_element)
+        # Extraer link: primero el atributo href y, si no hay, el texto del elemento
+        data['link'] = self._xp_link_href(entry) or self._xp_link_text(entry).strip() or None
+            
+        # URI del pliego de prescripciones técnicas (dentro de cac-place-ext:ContractFolderStatus)
+        document_uri = self._xp_tech_uri(entry).strip()
+        if document_uri:
+            data['document_uri'] = document_uri
         
-        # Buscar todos los cac:PartyName y concatenar sus cbc:Name
+        # Concatenar el cbc:Name de cada cac:PartyName y el código de cada
+        # clasificación de commodities, recorriendo la entrada una sola vez
         party_names = []
-        
-        # Buscar en toda la entrada
-        for party_name_elem in entry.findall('.//cac:PartyName', namespaces):
-            name_elem = party_name_elem.find('cbc:Name', namespaces)
-            if name_elem is None:
-                name_elem = party_name_elem.find('Name')
-            if name_elem is not None and name_elem.text:
-                party_names.append(name_elem.text.strip())
-        
-        # Si no encontramos con namespaces, intentar sin ellos
-        if not party_names:
-            for party_name_elem in entry.findall('.//PartyName'):
-                name_elem = party_name_elem.find('Name')
-                if name_elem is not None and name_elem.text:
-                    party_names.append(name_elem.text.strip())
-        
-        # Concatenar todos los nombres encontrados
-        data['party_names'] = ' | '.join(party_names) if party_names else None
-        
-        # Buscar todos los códigos de clasificación de commodities
         classification_codes = []
-        
-        # Buscar en toda la entrada
-        for classification_elem in entry.findall('.//cac:RequiredCommodityClassification', namespaces):
-            code_elem = classification_elem.find('cbc:ItemClassificationCode', namespaces)
-            if code_elem is None:
-                code_elem = classification_elem.find('ItemClassificationCode')
-            if code_elem is not None and code_elem.text:
-                classification_codes.append(code_elem.text.strip())
-        
-        # Si no encontramos con namespaces, intentar sin ellos
-        if not classification_codes:
-            for classification_elem in entry.findall('.//RequiredCommodityClassification'):
-                code_elem = classification_elem.find('ItemClassificationCode')
-                if code_elem is not None and code_elem.text:
-                    classification_codes.append(code_elem.text.strip())
-        
-        # Concatenar todos los códigos encontrados
+        for elem in entry.iter(self._q_party_name, self._q_commodity):
+            if elem.tag == self._q_party_name:
+                target, child_tag = party_names, self._q_name
+            else:
+                target, child_tag = classification_codes, self._q_code
+            # Solo el primer hijo de cada elemento, como hacía find()
+            child = next(elem.iterchildren(child_tag), None)
+            if child is not None and child.text:
+                target.append(child.text.strip())
+        data['party_names'] = ' | '.join(party_names) if party_names else None
         data['classification_codes'] = ' | '.join(classification_codes) if classification_codes else None
         
         # Debug: mostrar lo que se extrajo
-        logger.debug(f"Datos extraídos de entry: {data}")
+        logger.debug("Datos extraídos de entry: %s", data)
                             
         return data if any(v for v in data.values() if v) else None
     
-    def _get_text(self, element) -> Optional[str]:
-        """Obtener texto de un elemento XML de forma segura."""
-        if element is not None and element.text:
-            return element.text.strip()
-        return None
-
     def download_document(self, uri: str, entry_id: str) -> Optional[str]:
         """
         Descargar documento desde URI.
@@ -378,9 +477,9 @@ class AtomExtractor:
             Ruta del archivo descargado o None si falla
         """
         try:
-            logger.info(f"Descargando documento desde: {uri}")
+            logger.info("Descargando documento desde: %s", uri)
             
-            response = self.session.get(uri, stream=True)
+            response = self._get_rate_limited(uri)
             response.raise_for_status()
             
             # Determinar nombre del archivo
@@ -396,32 +495,91 @@ class AtomExtractor:
                     # Generar nombre basado en entry_id
                     filename = f"{entry_id.replace('/', '_').replace(':', '_')}.pdf"
                     
-            file_path = self.download_dir / filename
-            
             # Evitar sobrescribir archivos
-            counter = 1
-            original_path = file_path
-            while file_path.exists():
-                stem = original_path.stem
-                suffix = original_path.suffix
-                file_path = self.download_dir / f"{stem}_{counter}{suffix}"
-                counter += 1
-                
-            with open(file_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            file_path, fd = self._create_download_file(filename)
+            
+            response.raw.decode_content = True
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1 << 20)
                     
-            logger.info(f"Documento descargado: {file_path}")
+            logger.info("Documento descargado: %s", file_path)
             return str(file_path)
             
         except requests.RequestException as e:
-            logger.error(f"Error descargando documento desde {uri}: {e}")
+            logger.error("Error descargando documento desde %s: %s", uri, e)
             return None
         except Exception as e:
-            logger.error(f"Error guardando documento: {e}")
+            logger.error("Error guardando documento: %s", e)
             return None
 
-    def process_entries(self, entries: List[Dict], name_filter: str = None, code_filter: str = None) -> List[Dict]:
+    def _get_rate_limited(self, uri: str) -> requests.Response:
+        """
+        Hacer una petición GET respetando el limitador de peticiones.
+        
+        Si el servidor responde 429, reduce la tasa, espera lo indicado en
+        Retry-After y reintenta hasta RATE_LIMIT_RETRIES veces.
+        
+        Args:
+            uri: URI a descargar
+            
+        Returns:
+            Respuesta en modo streaming (la última 429 si se agotan los reintentos)
+        """
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self.limiter.consume()
+            response = self.session.get(uri, stream=True)
+            if response.status_code != 429:
+                self.limiter.increase()
+                return response
+                
+            self.limiter.decrease()
+            if attempt == RATE_LIMIT_RETRIES:
+                break
+            response.close()
+            
+            try:
+                delay = float(response.headers.get('Retry-After', 1))
+            except ValueError:
+                delay = 1.0
+            logger.warning("Servidor saturado (429), bajando a %.2f peticiones/s y esperando %s s",
+                           self.limiter.rate, delay)
+            time.sleep(delay)
+            
+        return response
+
+    def _create_download_file(self, filename: str) -> Tuple[Path, int]:
+        """
+        Crear en exclusiva el archivo de una descarga, añadiendo un sufijo
+        numérico si el nombre ya está en uso.
+        
+        Args:
+            filename: Nombre de archivo deseado
+            
+        Returns:
+            Ruta del archivo creado y su descriptor abierto para escritura
+        """
+        stem = Path(filename).stem
+        suffix = Path(filename).suffix
+        name = filename
+        counter = 0
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+        
+        while True:
+            # Reservar un nombre no usado en esta ejecución
+            with self._download_lock:
+                while name in self._used_names:
+                    counter += 1
+                    name = f"{stem}_{counter}{suffix}"
+                self._used_names.add(name)
+                
+            # La creación exclusiva detecta los archivos de ejecuciones anteriores
+            file_path = self.download_dir / name
+            try:
+                return file_path, os.open(file_path, flags)
+            except FileExistsError:
+                continue
+
+    def process_entries(self, entries: List[Dict], name_filter: str = None, code_filter: str = None, download_workers: int = 4) -> List[Dict]:
         """
         Procesar entradas y descargar documentos asociados.
         
@@ -429,46 +587,61 @@ class AtomExtractor:
             entries: Lista de entradas extraídas
             name_filter: Filtro opcional por subcadena en party_names
             code_filter: Filtro opcional por subcadena en classification_codes
+            download_workers: Número de descargas simultáneas
             
         Returns:
             Lista de entradas con información de descarga
         """
-        processed_entries = []
+        selected_entries = []
+        
+        # Preparar los filtros una sola vez (búsqueda de subcadena sin distinguir mayúsculas)
+        name_pattern = re.compile(re.escape(name_filter), re.IGNORECASE) if name_filter else None
+        code_pattern = re.compile(re.escape(code_filter), re.IGNORECASE) if code_filter else None
         
         for entry in entries:
-            logger.info(f"Procesando entrada: {entry.get('id', 'Sin ID')}")
+            logger.info("Procesando entrada: %s", entry.get('id', 'Sin ID'))
             
             # Aplicar filtro por nombre si se especifica
-            if name_filter:
+            if name_pattern:
                 party_names = entry.get('party_names', '')
-                if not party_names or name_filter.lower() not in party_names.lower():
-                    logger.debug(f"Entrada filtrada por nombre: {name_filter} no encontrado en {party_names}")
+                if not party_names or not name_pattern.search(party_names):
+                    logger.debug("Entrada filtrada por nombre: %s no encontrado en %s", name_filter, party_names)
                     continue
             
             # Aplicar filtro por código si se especifica
-            if code_filter:
+            if code_pattern:
                 classification_codes = entry.get('classification_codes', '')
-                if not classification_codes or code_filter.lower() not in classification_codes.lower():
-                    logger.debug(f"Entrada filtrada por código: {code_filter} no encontrado en {classification_codes}")
+                if not classification_codes or not code_pattern.search(classification_codes):
+                    logger.debug("Entrada filtrada por código: %s no encontrado en %s", code_filter, classification_codes)
                     continue
                     
-            # Descargar documento si tiene URI
-            if entry.get('document_uri'):
-                downloaded_file = self.download_document(
-                    entry['document_uri'], 
-                    entry.get('id', 'unknown')
-                )
-                entry['downloaded_file'] = downloaded_file
-            else:
-                entry['downloaded_file'] = None
-                logger.info("No se encontró URI de documento para esta entrada")
-                
-            processed_entries.append(entry)
+            selected_entries.append(entry)
+            
+        # Descargar los documentos en paralelo, conservando el orden de las entradas
+        with ThreadPoolExecutor(max_workers=max(1, download_workers)) as executor:
+            return list(executor.map(self._download_entry_document, selected_entries))
+
+    def _download_entry_document(self, entry: Dict) -> Dict:
+        """
+        Descargar el documento de una entrada, si tiene URI.
+        
+        Args:
+            entry: Entrada filtrada
             
-            # Pequeña pausa para no sobrecargar el servidor
-            time.sleep(0.5)
+        Returns:
+            La entrada con la ruta del archivo descargado
+        """
+        if not entry.get('document_uri'):
+            entry['downloaded_file'] = None
+            logger.info("No se encontró URI de documento para la entrada: %s", entry.get('id', 'Sin ID'))
+            return entry
             
-        return processed_entries
+        entry['downloaded_file'] = self.download_document(
+            entry['document_uri'], 
+            entry.get('id', 'unknown')
+        )
+        
+        return entry
 
     def save_results(self, all_entries: List[Dict], output_file: str = "extracted_data.txt"):
         """
@@ -478,24 +651,33 @@ class AtomExtractor:
             all_entries: Todas las entradas procesadas
             output_file: Archivo donde guardar los resultados
         """
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
             f.write(f"Datos extraídos - Total de entradas: {len(all_entries)}\n")
             f.write("=" * 50 + "\n\n")
             
+            # Acumular el texto de las entradas y escribirlo por lotes
+            parts = []
             for i, entry in enumerate(all_entries, 1):
-                f.write(f"ENTRADA {i}:\n")
-                f.write(f"ID: {entry.get('id', 'N/A')}\n")
-                f.write(f"Título: {entry.get('title', 'N/A')}\n")
-                f.write(f"Link: {entry.get('link', 'N/A')}\n")
-                f.write(f"Resumen: {entry.get('summary', 'N/A')}\n")
-                f.write(f"Actualizado: {entry.get('updated', 'N/A')}\n")
-                f.write(f"URI Documento: {entry.get('document_uri', 'N/A')}\n")
-                f.write(f"Nombres de Partes: {entry.get('party_names', 'N/A')}\n")
-                f.write(f"Códigos de Clasificación: {entry.get('classification_codes', 'N/A')}\n")
-                f.write(f"Archivo Descargado: {entry.get('downloaded_file', 'N/A')}\n")
-                f.write("-" * 30 + "\n\n")
+                parts.append(
+                    f"ENTRADA {i}:\n"
+                    f"ID: {entry.get('id', 'N/A')}\n"
+                    f"Título: {entry.get('title', 'N/A')}\n"
+                    f"Link: {entry.get('link', 'N/A')}\n"
+                    f"Resumen: {entry.get('summary', 'N/A')}\n"
+                    f"Actualizado: {entry.get('updated', 'N/A')}\n"
+                    f"URI Documento: {entry.get('document_uri', 'N/A')}\n"
+                    f"Nombres de Partes: {entry.get('party_names', 'N/A')}\n"
+                    f"Códigos de Clasificación: {entry.get('classification_codes', 'N/A')}\n"
+                    f"Archivo Descargado: {entry.get('downloaded_file', 'N/A')}\n"
+                    f"{'-' * 30}\n\n"
+                )
+                if i % 1000 == 0:
+                    f.write(''.join(parts))
+                    parts.clear()
+                    
+            f.write(''.join(parts))
                 
-        logger.info(f"Resultados guardados en: {output_file}")
+        logger.info("Resultados guardados en: %s", output_file)
 
     def inspect_atom_file(self, file_path: str) -> None:
         """
@@ -505,7 +687,7 @@ class AtomExtractor:
             file_path: Ruta del archivo .atom
         """
         try:
-            tree = ET.parse(file_path)
+            tree = etree.parse(file_path, parser=self._parser)
             root = tree.getroot()
             
             print(f"\n=== INSPECCIÓN DE {file_path} ===")
@@ -515,40 +697,46 @@ class AtomExtractor:
             # Función recursiva para mostrar jerarquía
             def show_hierarchy(element, level=0, max_level=3):
                 indent = "  " * level
-                tag_name = element.tag.split('}')[-1] if '}' in element.tag else element.tag
+                tag_name = etree.QName(element).localname
                 print(f"{indent}- {tag_name} ({element.tag})")
                 
                 if level < max_level:
-                    children_shown = 0
-                    for child in element:
-                        if children_shown < 5:  # Limitar a 5 hijos por nivel
-                            show_hierarchy(child, level + 1, max_level)
-                            children_shown += 1
-                        elif children_shown == 5:
-                            print(f"{indent}  ... (y {len(list(element)) - 5} más)")
+                    # Solo elementos: lxml también devuelve comentarios e instrucciones de proceso
+                    for shown, child in enumerate(element.iterchildren(etree.Element)):
+                        if shown == 5:  # Limitar a 5 hijos por nivel
+                            remaining = sum(1 for _ in element.iterchildren(etree.Element)) - 5
+                            print(f"{indent}  ... (y {remaining} más)")
                             break
+                        show_hierarchy(child, level + 1, max_level)
             
             print(f"\nJerarquía de elementos (primeros 3 niveles):")
             show_hierarchy(root)
                     
-            # Buscar cualquier elemento que sea exactamente 'entry'
+            # Buscar cualquier elemento 'entry', en cualquier espacio de nombres
             print(f"\nElementos 'entry' encontrados:")
             entry_count = 0
-            for elem in root.iter():
-                tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                if tag_name == 'entry':
-                    parent_tag = elem.getparent().tag if hasattr(elem, 'getparent') and elem.getparent() is not None else 'root'
-                    parent_name = parent_tag.split('}')[-1] if '}' in parent_tag else parent_tag
-                    print(f"  - entry #{entry_count + 1}: {elem.tag} (padre: {parent_name})")
+            for _, elem in etree.iterwalk(root, events=('start',), tag='{*}entry'):
+                # Pasado el límite se siguen contando, pero sin listarlas
+                if entry_count >= INSPECT_MAX_ENTRIES:
+                    if entry_count == INSPECT_MAX_ENTRIES:
+                        print(f"  ... (se muestran solo los primeros {INSPECT_MAX_ENTRIES})")
                     entry_count += 1
+                    continue
                     
-                    # Mostrar algunos hijos del entry
-                    if entry_count == 1:  # Solo para el primer entry
-                        print(f"    Hijos del primer entry:")
-                        for child in list(elem)[:10]:  # Primeros 10 hijos
-                            child_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                            print(f"      - {child_name}: {child.text[:50] if child.text else 'No text'}...")
-                            
+                parent = elem.getparent()
+                parent_name = etree.QName(parent).localname if parent is not None else 'root'
+                print(f"  - entry #{entry_count + 1}: {elem.tag} (padre: {parent_name})")
+                entry_count += 1
+                
+                # Mostrar algunos hijos del entry
+                if entry_count == 1:  # Solo para el primer entry
+                    print(f"    Hijos del primer entry:")
+                    for shown, child in enumerate(elem.iterchildren(etree.Element)):
+                        if shown == 10:  # Primeros 10 hijos
+                            break
+                        child_name = etree.QName(child).localname
+                        print(f"      - {child_name}: {child.text[:50] if child.text else 'No text'}...")
+                        
             if entry_count == 0:
                 print("  ❌ No se encontraron elementos 'entry'")
             else:
@@ -559,7 +747,7 @@ class AtomExtractor:
             import traceback
             traceback.print_exc()
 
-    def run(self, source: str, is_url: bool = True, inspect_only: bool = False, is_atom_file: bool = False, name_filter: str = None, code_filter: str = None, output_file: str = "extracted_data.txt") -> List[Dict]:
+    def run(self, source: str, is_url: bool = True, inspect_only: bool = False, is_atom_file: bool = False, name_filter: str = None, code_filter: str = None, output_file: str = "extracted_data.txt", workers: int = 1, download_workers: int = 4) -> List[Dict]:
         """
         Ejecutar el proceso completo de extracción.
         
@@ -571,6 +759,8 @@ class AtomExtractor:
             name_filter: Filtro opcional por subcadena en party_names
             code_filter: Filtro opcional por subcadena en classification_codes
             output_file: Nombre del archivo donde guardar los resultados
+            workers: Número de procesos para parsear los archivos .atom del ZIP
+            download_workers: Número de descargas simultáneas de documentos
             
         Returns:
             Lista de todas las entradas procesadas
@@ -585,9 +775,9 @@ class AtomExtractor:
                     self.inspect_atom_file(source)
                     return []
                 
-                logger.info(f"Procesando archivo .atom directamente: {source}")
+                logger.info("Procesando archivo .atom directamente: %s", source)
                 entries = self.parse_atom_file(source)
-                processed_entries = self.process_entries(entries, name_filter, code_filter)
+                processed_entries = self.process_entries(entries, name_filter, code_filter, download_workers)
                 
                 # Mostrar estadísticas del filtro
                 filters_applied = []
@@ -598,12 +788,12 @@ class AtomExtractor:
                     
                 if filters_applied:
                     filter_str = ", ".join(filters_applied)
-                    logger.info(f"Filtros aplicados ({filter_str}) -> {len(processed_entries)}/{len(entries)} entradas")
+                    logger.info("Filtros aplicados (%s) -> %s/%s entradas", filter_str, len(processed_entries), len(entries))
                 
                 # Guardar resultados
                 self.save_results(processed_entries, output_file)
                 
-                logger.info(f"Proceso completado. Total de entradas procesadas: {len(processed_entries)}")
+                logger.info("Proceso completado. Total de entradas procesadas: %s", len(processed_entries))
                 return processed_entries
             
             # Proceso normal con ZIP
@@ -615,31 +805,30 @@ class AtomExtractor:
                 if not os.path.exists(zip_path):
                     raise FileNotFoundError(f"Archivo ZIP no encontrado: {zip_path}")
                     
-            # Paso 2: Extraer ZIP
-            extract_dir = self.extract_zip(zip_path)
-            
-            # Paso 3: Buscar archivos .atom
-            atom_files = self.find_atom_files(extract_dir)
-            
-            if not atom_files:
-                logger.warning("No se encontraron archivos .atom")
-                return []
-                
             # Si solo queremos inspeccionar
             if inspect_only:
+                atom_files = self.find_atom_files(self.extract_zip(zip_path))
+                if not atom_files:
+                    logger.warning("No se encontraron archivos .atom")
+                    return []
                 self.inspect_atom_file(atom_files[0])
                 return []
                 
-            # Paso 4: Procesar cada archivo .atom
+            # Pasos 2 a 4: Procesar cada archivo .atom leyéndolo directamente del ZIP
             all_entries = []
             total_before_filter = 0
+            atom_count = 0
             
-            for atom_file in atom_files:
-                entries = self.parse_atom_file(atom_file)
+            for entries in self.parse_zip_atom_files(zip_path, workers):
+                atom_count += 1
                 total_before_filter += len(entries)
-                processed_entries = self.process_entries(entries, name_filter, code_filter)
+                processed_entries = self.process_entries(entries, name_filter, code_filter, download_workers)
                 all_entries.extend(processed_entries)
                 
+            if not atom_count:
+                logger.warning("No se encontraron archivos .atom")
+                return []
+                
             # Mostrar estadísticas del filtro
             filters_applied = []
             if name_filter:
@@ -649,7 +838,7 @@ class AtomExtractor:
                 
             if filters_applied:
                 filter_str = ", ".join(filters_applied)
-                logger.info(f"Filtros aplicados ({filter_str}) -> {len(all_entries)}/{total_before_filter} entradas totales")
+                logger.info("Filtros aplicados (%s) -> %s/%s entradas totales", filter_str, len(all_entries), total_before_filter)
                 
             # Paso 5: Guardar resultados
             self.save_results(all_entries, output_file)
@@ -658,11 +847,11 @@ class AtomExtractor:
             if is_url and os.path.exists(zip_path):
                 os.remove(zip_path)
                 
-            logger.info(f"Proceso completado. Total de entradas procesadas: {len(all_entries)}")
+            logger.info("Proceso completado. Total de entradas procesadas: %s", len(all_entries))
             return all_entries
             
         except Exception as e:
-            logger.error(f"Error en el proceso: {e}")
+            logger.error("Error en el proceso: %s", e)
             raise
 
 
@@ -684,9 +873,21 @@ def main():
                        help='Filtrar entradas por subcadena en nombres de partes (case-insensitive)')
     parser.add_argument('--filter-code', type=str, default=None,
                        help='Filtrar entradas por subcadena en códigos de clasificación (case-insensitive)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Número de procesos para parsear los archivos .atom (default: 1)')
+    parser.add_argument('--download-workers', type=int, default=4,
+                       help='Número de documentos a descargar simultáneamente (default: 4)')
+    parser.add_argument('--rps', type=float, default=5.0,
+                       help='Peticiones por segundo máximas al descargar documentos; se reduce si el servidor responde 429 (default: 5)')
+    parser.add_argument('--verbose', '-v', action='store_true',
+                       help='Mostrar información detallada de procesamiento')
     
     args = parser.parse_args()
     
+    # Configurar nivel de logging
+    if args.verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
     # Validaciones
     if args.atom and not args.local:
         print("❌ Error: Si usas --atom, también debes usar --local")
@@ -695,9 +896,13 @@ def main():
     if args.atom and not args.source.endswith('.atom'):
         print("❌ Error: Con --atom, el archivo debe tener extensión .atom")
         sys.exit(1)
+        
+    if args.rps <= 0:
+        print("❌ Error: --rps debe ser mayor que 0")
+        sys.exit(1)
     
     try:
-        extractor = AtomExtractor(download_dir=args.output_dir)
+        extractor = AtomExtractor(download_dir=args.output_dir, rps=args.rps)
         
         if args.inspect:
             print("🔍 Modo inspección activado...")
@@ -722,7 +927,9 @@ def main():
                 is_atom_file=args.atom,
                 name_filter=args.filter_name,
                 code_filter=args.filter_code,
-                output_file=args.output_file
+                output_file=args.output_file,
+                workers=args.workers,
+                download_workers=args.download_workers
             )
             
             print(f"\n✅ Proceso completado exitosamente!")
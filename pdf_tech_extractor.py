@@ -7,32 +7,44 @@ Analiza documentos en un directorio y busca palabras clave relacionadas con IT.
 import os
 import sys
 import re
+import csv
+import hashlib
+import mmap
+import importlib.util
 import argparse
 import logging
 from pathlib import Path
-from typing import List, Dict, Set, Optional
+from typing import List, Dict, Iterator, Set, Optional, Tuple
 import json
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
-try:
-    import PyPDF2
-except ImportError:
+# Las librerías de PDF se importan al usarlas por primera vez (ver _load_pdf_backend),
+# pero PyPDF2 es imprescindible como último recurso
+if importlib.util.find_spec('PyPDF2') is None:
     print("❌ Error: PyPDF2 no está instalado. Instálalo con: pip install PyPDF2")
     sys.exit(1)
 
-try:
-    import pdfplumber
-except ImportError:
-    print("⚠️  Advertencia: pdfplumber no está instalado. Funcionalidad limitada.")
-    print("   Para mejor extracción de texto: pip install pdfplumber")
-    pdfplumber = None
-
 try:
     import yaml
 except ImportError:
     print("❌ Error: PyYAML no está instalado. Instálalo con: pip install PyYAML")
     sys.exit(1)
 
+try:
+    import ahocorasick
+except ImportError:
+    # Opcional: sin pyahocorasick se busca cada palabra clave con una expresión regular
+    ahocorasick = None
+
+# Cabecera del CSV de resultados
+CSV_HEADER = ['Documento', 'Tecnologia_Encontrada']
+
+# Usar el loader/dumper en C de libyaml si PyYAML se compiló con él
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,6 +52,127 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+def _is_word_char(char: str) -> bool:
+    """Indicar si un carácter es de palabra, con el mismo criterio que \\w."""
+    return char.isalnum() or char == '_'
+
+
+def _at_word_boundaries(text: str, start: int, end: int) -> bool:
+    """
+    Comprobar que text[start:end] está delimitado como lo haría \\b...\\b.
+    
+    Args:
+        text: Texto completo
+        start: Posición inicial de la coincidencia
+        end: Posición final de la coincidencia (exclusiva)
+        
+    Returns:
+        True si hay límite de palabra en ambos extremos
+    """
+    before = start > 0 and _is_word_char(text[start - 1])
+    after = end < len(text) and _is_word_char(text[end])
+    return before != _is_word_char(text[start]) and after != _is_word_char(text[end - 1])
+
+
+def _file_digest(path: str) -> str:
+    """
+    Calcular el hash SHA-1 del contenido de un archivo, leyéndolo por bloques.
+    
+    Args:
+        path: Ruta del archivo
+        
+    Returns:
+        Hash en hexadecimal
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _contains_word(text: str, keyword: str) -> bool:
+    """
+    Buscar una palabra clave completa en el texto, como \\bkeyword\\b pero
+    comprobando los límites de palabra solo donde aparece.
+    
+    Args:
+        text: Texto normalizado
+        keyword: Palabra clave en minúsculas
+        
+    Returns:
+        True si la palabra clave aparece delimitada por límites de palabra
+    """
+    start = text.find(keyword)
+    while start != -1:
+        if _at_word_boundaries(text, start, start + len(keyword)):
+            return True
+        start = text.find(keyword, start + 1)
+    return False
+
+
+def _is_searchable(keyword: str) -> bool:
+    """
+    Indicar si una palabra clave puede aparecer en un texto normalizado, que
+    solo contiene caracteres de palabra, puntos, guiones y espacios simples.
+    
+    Args:
+        keyword: Palabra clave en minúsculas
+        
+    Returns:
+        True si la palabra clave puede encontrarse
+    """
+    return bool(keyword) and '  ' not in keyword and all(_is_word_char(char) or char in ' .-' for char in keyword)
+
+
+@lru_cache(maxsize=None)
+def _load_pdf_backend(*names: str):
+    """
+    Importar una librería de PDF la primera vez que se necesita.
+    
+    Args:
+        names: Nombres alternativos del módulo, por orden de preferencia
+        
+    Returns:
+        El módulo importado, o None si no está instalado
+    """
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    logger.debug(f"Librería de PDF no instalada: {' / '.join(names)}")
+    return None
+
+
+# Normalización de texto: caracteres que no son de palabra, espacios, puntos
+# ni guiones se cambian por espacios. Para texto ASCII basta una tabla de
+# str.translate que además pasa a minúsculas; para el resto, una regex.
+_ASCII_NORMALIZE_TABLE = {
+    code: (chr(code).lower() if _is_word_char(chr(code)) or chr(code).isspace() or chr(code) in '.-' else ' ')
+    for code in range(128)
+}
+_SPECIAL_CHARS = re.compile(r'[^\w\s\.\-]')
+_WORD_SEPARATORS = str.maketrans('.-', '  ')
+_NON_WORD_CHARS = ' .-'
+
+
+# Extractor de cada proceso del pool de análisis
+_worker_extractor = None
+
+
+def _init_worker(output_dir: str, keywords_file: str) -> None:
+    """Crear el extractor de un proceso del pool."""
+    global _worker_extractor
+    _worker_extractor = TechExtractor(output_dir=output_dir, keywords_file=keywords_file)
+
+
+def _analyze_file(pdf_path: str, digest: Optional[str] = None) -> Dict:
+    """Analizar un PDF en un proceso del pool."""
+    return _worker_extractor.analyze_file(pdf_path, digest)
+
+
 class TechExtractor:
     def __init__(self, output_dir: str = "tech_analysis", keywords_file: str = "tech_keywords.yaml"):
         """
@@ -52,6 +185,10 @@ class TechExtractor:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Caché del texto extraído de cada PDF, indexada por el hash de su contenido
+        self.text_cache_dir = self.output_dir / ".text_cache"
+        self.text_cache_dir.mkdir(exist_ok=True)
+        
         self.keywords_file = keywords_file
         
         # Cargar palabras clave desde archivo YAML
@@ -61,6 +198,42 @@ class TechExtractor:
         self.all_keywords = set()
         for category, keywords in self.tech_keywords.items():
             self.all_keywords.update([kw.lower() for kw in keywords])
+            
+        # Solo se buscan las palabras clave que pueden aparecer en un texto normalizado
+        self._searchable_keywords = {keyword for keyword in self.all_keywords if _is_searchable(keyword)}
+        unsearchable = sorted(self.all_keywords - self._searchable_keywords)
+        if unsearchable:
+            logger.debug(f"Palabras clave que nunca se encontrarán tras normalizar el texto: {unsearchable}")
+            
+        # Autómata Aho-Corasick para buscar todas las palabras clave en una sola pasada
+        self.automaton = self.build_automaton()
+        
+        # Sin autómata: las palabras clave de una sola palabra se buscan entre las
+        # palabras del texto y el resto con expresiones regulares
+        self._single_keywords = {
+            keyword for keyword in self._searchable_keywords
+            if all(_is_word_char(char) for char in keyword)
+        }
+        self._phrase_keywords = sorted(self._searchable_keywords - self._single_keywords)
+        
+    def build_automaton(self):
+        """
+        Construir el autómata Aho-Corasick con todas las palabras clave.
+        
+        Returns:
+            Autómata listo para buscar, o None si pyahocorasick no está disponible
+        """
+        if ahocorasick is None or not self._searchable_keywords:
+            return None
+            
+        # Cada palabra clave guarda su longitud y si empieza y termina con carácter
+        # de palabra, para comprobar los límites sin recalcularlo en cada coincidencia
+        automaton = ahocorasick.Automaton()
+        for keyword in self._searchable_keywords:
+            automaton.add_word(keyword, (keyword, len(keyword), _is_word_char(keyword[0]), _is_word_char(keyword[-1])))
+        automaton.make_automaton()
+        
+        return automaton
     
     def create_default_keywords_file(self) -> Dict:
         """
@@ -166,7 +339,7 @@ class TechExtractor:
             
             # Guardar archivo por defecto
             with open(keywords_path, 'w', encoding='utf-8') as f:
-                yaml.dump(default_keywords, f, default_flow_style=False, 
+                yaml.dump(default_keywords, f, Dumper=YAML_DUMPER, default_flow_style=False, 
                          allow_unicode=True, sort_keys=False, indent=2)
             
             logger.info(f"Archivo creado: {self.keywords_file}")
@@ -177,7 +350,7 @@ class TechExtractor:
         # Cargar archivo existente
         try:
             with open(keywords_path, 'r', encoding='utf-8') as f:
-                keywords = yaml.safe_load(f)
+                keywords = yaml.load(f, Loader=YAML_LOADER)
             
             if not isinstance(keywords, dict):
                 raise ValueError("El archivo YAML debe contener un diccionario")
@@ -192,6 +365,31 @@ class TechExtractor:
             logger.info("Usando palabras clave por defecto")
             return self.create_default_keywords_file()
     
+    def extract_text_pymupdf(self, pdf_path: str) -> str:
+        """
+        Extraer texto usando PyMuPDF (el más rápido).
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            
+        Returns:
+            Texto extraído del PDF
+        """
+        pages = []
+        try:
+            fitz = _load_pdf_backend('pymupdf', 'fitz')
+            with fitz.open(pdf_path) as doc:
+                for page in doc:
+                    try:
+                        pages.append(page.get_text("text"))
+                    except Exception as e:
+                        logger.debug(f"Error extrayendo página: {e}")
+                        continue
+        except Exception as e:
+            logger.error(f"Error leyendo PDF con PyMuPDF: {e}")
+        
+        return "".join(pages)
+    
     def extract_text_pypdf2(self, pdf_path: str) -> str:
         """
         Extraer texto usando PyPDF2.
@@ -202,20 +400,22 @@ class TechExtractor:
         Returns:
             Texto extraído del PDF
         """
-        text = ""
+        pages = []
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            # Mapear el archivo en memoria: el sistema carga bajo demanda las
+            # partes que PyPDF2 lee, sin las lecturas pequeñas del buffer de archivo
+            with open(pdf_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                pdf_reader = _load_pdf_backend('PyPDF2').PdfReader(data)
                 for page in pdf_reader.pages:
                     try:
-                        text += page.extract_text() + "\n"
+                        pages.append(page.extract_text() + "\n")
                     except Exception as e:
                         logger.debug(f"Error extrayendo página: {e}")
                         continue
         except Exception as e:
             logger.error(f"Error leyendo PDF con PyPDF2: {e}")
         
-        return text
+        return "".join(pages)
     
     def extract_text_pdfplumber(self, pdf_path: str) -> str:
         """
@@ -227,23 +427,64 @@ class TechExtractor:
         Returns:
             Texto extraído del PDF
         """
-        text = ""
+        pages = []
         try:
+            pdfplumber = _load_pdf_backend('pdfplumber')
             with pdfplumber.open(pdf_path) as pdf:
                 for page in pdf.pages:
                     try:
                         page_text = page.extract_text()
                         if page_text:
-                            text += page_text + "\n"
+                            pages.append(page_text)
+                            pages.append("\n")
                     except Exception as e:
                         logger.debug(f"Error extrayendo página: {e}")
                         continue
+                    finally:
+                        # Liberar los caracteres y objetos de la página ya leída
+                        page.flush_cache()
         except Exception as e:
             logger.error(f"Error leyendo PDF con pdfplumber: {e}")
         
+        return "".join(pages)
+    
+    def extract_text_from_pdf(self, pdf_path: str, digest: Optional[str] = None) -> str:
+        """
+        Extraer texto de un PDF, reutilizando el de ejecuciones anteriores
+        si el contenido del PDF no ha cambiado.
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            digest: Hash del contenido del PDF, si ya se ha calculado
+            
+        Returns:
+            Texto extraído del PDF
+        """
+        cache_path = self.text_cache_dir / f"{digest or _file_digest(pdf_path)}.txt"
+        
+        try:
+            text = cache_path.read_text(encoding='utf-8')
+            logger.debug(f"Texto de {pdf_path} leído de la caché: {cache_path}")
+            return text
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Error leyendo la caché {cache_path}: {e}")
+            
+        text = self.extract_text_uncached(pdf_path)
+        
+        # Guardar solo si hay texto, para reintentar los PDFs que fallan
+        if text.strip():
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                tmp_path.write_text(text, encoding='utf-8')
+                os.replace(tmp_path, cache_path)
+            except (OSError, UnicodeError) as e:
+                logger.debug(f"Error guardando la caché {cache_path}: {e}")
+                
         return text
     
-    def extract_text_from_pdf(self, pdf_path: str) -> str:
+    def extract_text_uncached(self, pdf_path: str) -> str:
         """
         Extraer texto de un PDF usando el mejor método disponible.
         
@@ -255,8 +496,13 @@ class TechExtractor:
         """
         logger.debug(f"Extrayendo texto de: {pdf_path}")
         
-        # Intentar primero con pdfplumber si está disponible
-        if pdfplumber:
+        # Intentar primero con PyMuPDF y después con pdfplumber, si están instalados
+        if _load_pdf_backend('pymupdf', 'fitz'):
+            text = self.extract_text_pymupdf(pdf_path)
+            if text.strip():
+                return text
+                
+        if _load_pdf_backend('pdfplumber'):
             text = self.extract_text_pdfplumber(pdf_path)
             if text.strip():
                 return text
@@ -275,16 +521,17 @@ class TechExtractor:
         Returns:
             Texto normalizado
         """
-        # Convertir a minúsculas
-        text = text.lower()
-        
-        # Reemplazar caracteres especiales con espacios
-        text = re.sub(r'[^\w\s\.\-]', ' ', text)
+        # Convertir a minúsculas y reemplazar caracteres especiales con espacios
+        if text.isascii():
+            text = text.translate(_ASCII_NORMALIZE_TABLE)
+        else:
+            text = text.lower()
+            # La búsqueda se detiene en el primer carácter especial; si no hay, no hace falta sustituir
+            if _SPECIAL_CHARS.search(text):
+                text = _SPECIAL_CHARS.sub(' ', text)
         
         # Normalizar espacios múltiples
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        return ' '.join(text.split())
     
     def find_technologies(self, text: str) -> Dict[str, List[str]]:
         """
@@ -299,27 +546,46 @@ class TechExtractor:
         normalized_text = self.normalize_text(text)
         found_technologies = defaultdict(list)
         
-        for category, keywords in self.tech_keywords.items():
-            found_in_category = []
-            
-            for keyword in keywords:
-                # Crear patrón de búsqueda con límites de palabra
-                pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
+        if self.automaton is not None:
+            # Una sola pasada por el texto para todas las palabras clave. En el texto
+            # normalizado, los únicos caracteres que no son de palabra son ' ', '.' y '-',
+            # así que basta mirar si el carácter vecino es uno de ellos
+            found = set()
+            last = len(normalized_text) - 1
+            total = len(self._searchable_keywords)
+            for end, (keyword, length, starts_word, ends_word) in self.automaton.iter(normalized_text):
+                if keyword in found:
+                    continue
+                start = end - length + 1
+                if (start > 0 and normalized_text[start - 1] not in _NON_WORD_CHARS) == starts_word:
+                    continue
+                if (end < last and normalized_text[end + 1] not in _NON_WORD_CHARS) == ends_word:
+                    continue
+                    
+                found.add(keyword)
+                # No queda nada por encontrar en el resto del texto
+                if len(found) == total:
+                    break
+        else:
+            # Las palabras del texto normalizado son lo que queda entre espacios, puntos y guiones
+            words = set(normalized_text.translate(_WORD_SEPARATORS).split())
+            found = self._single_keywords & words
+            found.update(keyword for keyword in self._phrase_keywords if _contains_word(normalized_text, keyword))
                 
-                if re.search(pattern, normalized_text):
-                    found_in_category.append(keyword)
-            
+        for category, keywords in self.tech_keywords.items():
+            found_in_category = [keyword for keyword in keywords if keyword.lower() in found]
             if found_in_category:
                 found_technologies[category] = found_in_category
         
         return dict(found_technologies)
     
-    def analyze_pdf(self, pdf_path: str) -> Dict:
+    def analyze_pdf(self, pdf_path: str, digest: Optional[str] = None) -> Dict:
         """
         Analizar un PDF individual.
         
         Args:
             pdf_path: Ruta del archivo PDF
+            digest: Hash del contenido del PDF, si ya se ha calculado
             
         Returns:
             Diccionario con el análisis del PDF
@@ -327,7 +593,7 @@ class TechExtractor:
         logger.info(f"Analizando: {os.path.basename(pdf_path)}")
         
         # Extraer texto
-        text = self.extract_text_from_pdf(pdf_path)
+        text = self.extract_text_from_pdf(pdf_path, digest)
         
         if not text.strip():
             logger.warning(f"No se pudo extraer texto de: {pdf_path}")
@@ -343,6 +609,11 @@ class TechExtractor:
         # Buscar tecnologías
         technologies = self.find_technologies(text)
         
+        # Quedarse solo con la longitud y el inicio del texto y liberar el resto
+        text_length = len(text)
+        text_preview = text[:500] + "..." if text_length > 500 else text
+        del text
+        
         # Contar total de tecnologías únicas
         total_tech = sum(len(tech_list) for tech_list in technologies.values())
         
@@ -350,22 +621,46 @@ class TechExtractor:
             'file': os.path.basename(pdf_path),
             'file_path': pdf_path,
             'text_extracted': True,
-            'text_length': len(text),
+            'text_length': text_length,
             'technologies': technologies,
             'total_technologies': total_tech,
-            'text_preview': text[:500] + "..." if len(text) > 500 else text
+            'text_preview': text_preview
         }
     
-    def process_directory(self, directory: str, pattern: str = "*.pdf") -> List[Dict]:
+    def analyze_file(self, pdf_path: str, digest: Optional[str] = None) -> Dict:
         """
-        Procesar todos los PDFs en un directorio.
+        Analizar un PDF, devolviendo un resultado con el error si falla.
+        
+        Args:
+            pdf_path: Ruta del archivo PDF
+            digest: Hash del contenido del PDF, si ya se ha calculado
+            
+        Returns:
+            Diccionario con el análisis del PDF
+        """
+        try:
+            return self.analyze_pdf(pdf_path, digest)
+        except Exception as e:
+            logger.error(f"Error procesando {pdf_path}: {e}")
+            return {
+                'file': os.path.basename(pdf_path),
+                'file_path': pdf_path,
+                'text_extracted': False,
+                'technologies': {},
+                'total_technologies': 0,
+                'error': str(e)
+            }
+    
+    def find_pdf_files(self, directory: str, pattern: str = "*.pdf") -> List[str]:
+        """
+        Buscar los PDFs de un directorio.
         
         Args:
             directory: Directorio a procesar
             pattern: Patrón de archivos a procesar
             
         Returns:
-            Lista de análisis de todos los PDFs
+            Lista de rutas de los PDFs encontrados
         """
         pdf_dir = Path(directory)
         
@@ -373,31 +668,98 @@ class TechExtractor:
             raise FileNotFoundError(f"Directorio no encontrado: {directory}")
         
         # Buscar archivos PDF
-        pdf_files = list(pdf_dir.glob(pattern))
+        pdf_files = [str(pdf_file) for pdf_file in pdf_dir.glob(pattern)]
         
         if not pdf_files:
             logger.warning(f"No se encontraron archivos PDF en: {directory}")
             return []
         
         logger.info(f"Encontrados {len(pdf_files)} archivos PDF para procesar")
+        return pdf_files
+    
+    def iter_analyses(self, pdf_files: List[str], workers: int = 1) -> Iterator[Dict]:
+        """
+        Analizar una lista de PDFs, devolviendo cada análisis en cuanto está listo.
         
-        results = []
+        Args:
+            pdf_files: Rutas de los PDFs
+            workers: Número de procesos para analizar los PDFs en paralelo
+            
+        Yields:
+            Análisis de cada PDF, en el mismo orden que pdf_files
+        """
+        # Agrupar los PDFs con el mismo contenido para analizar cada uno una sola vez
+        keys = []
+        unique = {}
         for pdf_file in pdf_files:
             try:
-                result = self.analyze_pdf(str(pdf_file))
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Error procesando {pdf_file}: {e}")
-                results.append({
-                    'file': pdf_file.name,
-                    'file_path': str(pdf_file),
-                    'text_extracted': False,
-                    'technologies': {},
-                    'total_technologies': 0,
-                    'error': str(e)
-                })
+                digest = _file_digest(pdf_file)
+            except OSError as e:
+                logger.debug(f"Error calculando el hash de {pdf_file}: {e}")
+                digest = None
+            keys.append(digest or pdf_file)
+            unique.setdefault(digest or pdf_file, (pdf_file, digest))
+            
+        if len(unique) < len(pdf_files):
+            logger.info(f"{len(pdf_files) - len(unique)} archivos duplicados reutilizarán el análisis de otro idéntico")
+            
+        unique_files = [pdf_file for pdf_file, _ in unique.values()]
+        unique_digests = [digest for _, digest in unique.values()]
+        
+        if workers <= 1 or len(unique_files) <= 1:
+            analyzed = (self.analyze_file(pdf_file, digest) for pdf_file, digest in zip(unique_files, unique_digests))
+            yield from self._expand_duplicates(pdf_files, keys, analyzed)
+        else:
+            # Cada PDF es independiente: repartirlos entre procesos, conservando el orden
+            with ProcessPoolExecutor(
+                max_workers=min(workers, len(unique_files)),
+                initializer=_init_worker,
+                initargs=(str(self.output_dir), self.keywords_file)
+            ) as executor:
+                analyzed = executor.map(_analyze_file, unique_files, unique_digests)
+                yield from self._expand_duplicates(pdf_files, keys, analyzed)
+                
+    def _expand_duplicates(self, pdf_files: List[str], keys: List[str], analyzed: Iterator[Dict]) -> Iterator[Dict]:
+        """
+        Replicar el análisis de cada contenido en todos los archivos que lo comparten.
         
-        return results
+        Args:
+            pdf_files: Rutas de los PDFs
+            keys: Clave de contenido de cada PDF
+            analyzed: Análisis de cada clave distinta, en orden de primera aparición
+            
+        Yields:
+            Análisis de cada PDF, en el mismo orden que pdf_files
+        """
+        # Guardar cada análisis solo mientras queden duplicados por devolver
+        remaining = Counter(keys)
+        pending = {}
+        for pdf_file, key in zip(pdf_files, keys):
+            if key not in pending:
+                pending[key] = next(analyzed)
+            result = pending[key]
+            
+            remaining[key] -= 1
+            if not remaining[key]:
+                del pending[key]
+                
+            if result['file_path'] != pdf_file:
+                result = dict(result, file=os.path.basename(pdf_file), file_path=pdf_file)
+            yield result
+    
+    def process_directory(self, directory: str, pattern: str = "*.pdf", workers: int = 1) -> List[Dict]:
+        """
+        Procesar todos los PDFs en un directorio.
+        
+        Args:
+            directory: Directorio a procesar
+            pattern: Patrón de archivos a procesar
+            workers: Número de procesos para analizar los PDFs en paralelo
+            
+        Returns:
+            Lista de análisis de todos los PDFs
+        """
+        return list(self.iter_analyses(self.find_pdf_files(directory, pattern), workers))
     
     def generate_summary(self, results: List[Dict]) -> Dict:
         """
@@ -454,6 +816,26 @@ class TechExtractor:
             }
         }
     
+    def csv_rows(self, result: Dict) -> List[Tuple[str, str]]:
+        """
+        Obtener las filas del CSV de un documento: una por cada tecnología única.
+        
+        Args:
+            result: Análisis del documento
+            
+        Returns:
+            Lista de filas (documento, tecnología)
+        """
+        if result.get('error') or not result.get('technologies'):
+            return []
+            
+        # Recopilar todas las tecnologías únicas encontradas en este documento
+        all_technologies = set()
+        for tech_list in result['technologies'].values():
+            all_technologies.update(tech_list)
+            
+        return [(result['file'], tech) for tech in sorted(all_technologies)]
+    
     def save_results_csv(self, results: List[Dict], csv_filename: str = "tecnologias_encontradas.csv"):
         """
         Guardar resultados en un único archivo CSV.
@@ -462,52 +844,39 @@ class TechExtractor:
             results: Lista de análisis de documentos
             csv_filename: Nombre del archivo CSV a generar
         """
-        import csv
-        
         csv_path = self.output_dir / csv_filename
         
+        # Una fila por cada tecnología única encontrada en cada documento
+        rows = []
+        docs_with_tech = 0
+        for result in results:
+            result_rows = self.csv_rows(result)
+            if result_rows:
+                docs_with_tech += 1
+                rows.extend(result_rows)
+        
         with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
             
             # Cabecera
-            writer.writerow(['Documento', 'Tecnologia_Encontrada'])
-            
-            # Procesar cada documento
-            for result in results:
-                if result.get('error') or not result.get('technologies'):
-                    continue
-                    
-                # Recopilar todas las tecnologías únicas encontradas en este documento
-                all_technologies = set()
-                for tech_list in result['technologies'].values():
-                    all_technologies.update(tech_list)
-                
-                # Una fila por cada tecnología única encontrada
-                for tech in sorted(all_technologies):
-                    writer.writerow([result['file'], tech])
-        
-        # Contar totales para el log
-        total_technologies = 0
-        docs_with_tech = 0
-        for result in results:
-            if result.get('technologies'):
-                docs_with_tech += 1
-                all_techs = set()
-                for tech_list in result['technologies'].values():
-                    all_techs.update(tech_list)
-                total_technologies += len(all_techs)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(rows)
         
         logger.info(f"CSV generado: {csv_path}")
-        logger.info(f"Total de filas: {total_technologies} (tecnologías de {docs_with_tech} documentos)")
+        logger.info(f"Total de filas: {len(rows)} (tecnologías de {docs_with_tech} documentos)")
     
-    def run(self, directory: str, pattern: str = "*.pdf", csv_filename: str = "tecnologias_encontradas.csv") -> Dict:
+    def run(self, directory: str, pattern: str = "*.pdf", csv_filename: str = "tecnologias_encontradas.csv", workers: int = 1) -> Dict:
         """
         Ejecutar el análisis completo.
         
+        Las filas del CSV se escriben según se analiza cada PDF, y de cada
+        análisis solo se conservan los datos que necesita el resumen.
+        
         Args:
             directory: Directorio con los PDFs
             pattern: Patrón de archivos a procesar
             csv_filename: Nombre del archivo CSV a generar
+            workers: Número de procesos para analizar los PDFs en paralelo
             
         Returns:
             Diccionario con resultados y resumen
@@ -515,19 +884,45 @@ class TechExtractor:
         logger.info(f"Iniciando análisis de tecnologías en: {directory}")
         logger.info(f"Usando archivo de palabras clave: {self.keywords_file}")
         
-        # Procesar directorio
-        results = self.process_directory(directory, pattern)
+        pdf_files = self.find_pdf_files(directory, pattern)
         
-        if not results:
+        if not pdf_files:
             logger.warning("No se procesaron archivos")
             return {'results': [], 'summary': {}}
         
+        # Procesar directorio, guardando los resultados en un único CSV
+        csv_path = self.output_dir / csv_filename
+        results = []
+        total_rows = 0
+        docs_with_tech = 0
+        
+        with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            
+            # Cabecera
+            writer.writerow(CSV_HEADER)
+            
+            for result in self.iter_analyses(pdf_files, workers):
+                rows = self.csv_rows(result)
+                if rows:
+                    writer.writerows(rows)
+                    total_rows += len(rows)
+                    docs_with_tech += 1
+                    
+                results.append({
+                    'file': result['file'],
+                    'text_extracted': result['text_extracted'],
+                    'technologies': result['technologies'],
+                    'total_technologies': result['total_technologies'],
+                    'error': result.get('error')
+                })
+        
+        logger.info(f"CSV generado: {csv_path}")
+        logger.info(f"Total de filas: {total_rows} (tecnologías de {docs_with_tech} documentos)")
+        
         # Generar resumen simple
         summary = self.generate_summary(results)
         
-        # Guardar resultados en un único CSV
-        self.save_results_csv(results, csv_filename)
-        
         logger.info(f"Análisis completado. Procesados {len(results)} archivos.")
         
         return {
@@ -548,6 +943,8 @@ def main():
                        help='Archivo YAML con palabras clave (default: tech_keywords.yaml)')
     parser.add_argument('--csv-file', default='tecnologias_encontradas.csv',
                        help='Nombre del archivo CSV a generar (default: tecnologias_encontradas.csv)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='Número de procesos para analizar los PDFs (default: número de CPUs)')
     parser.add_argument('--verbose', '-v', action='store_true',
                        help='Mostrar información detallada de procesamiento')
     
@@ -559,7 +956,7 @@ def main():
     
     try:
         extractor = TechExtractor(output_dir=args.output_dir, keywords_file=args.keywords_file)
-        results = extractor.run(args.directory, args.pattern, args.csv_file)
+        results = extractor.run(args.directory, args.pattern, args.csv_file, args.workers)
         
         summary = results['summary']
         
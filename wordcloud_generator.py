@@ -6,6 +6,8 @@ con tecnologías informáticas extraídas de documentos PDF.
 
 import os
 import sys
+import bisect
+import json
 import argparse
 import logging
 from pathlib import Path
@@ -15,12 +17,14 @@ import pandas as pd
 
 try:
     from wordcloud import WordCloud
+    from wordcloud.wordcloud import FONT_PATH
 except ImportError:
     print("❌ Error: wordcloud no está instalado. Instálalo con: pip install wordcloud")
     sys.exit(1)
 
 try:
-    import matplotlib.pyplot as plt
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
     import matplotlib.colors as mcolors
 except ImportError:
     print("❌ Error: matplotlib no está instalado. Instálalo con: pip install matplotlib")
@@ -32,6 +36,9 @@ except ImportError:
     print("❌ Error: numpy no está instalado. Instálalo con: pip install numpy")
     sys.exit(1)
 
+# Pillow es dependencia de wordcloud y matplotlib
+from PIL import Image, ImageDraw, ImageFont
+
 # Configurar logging
 logging.basicConfig(
     level=logging.INFO,
@@ -39,6 +46,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Filas del CSV leídas en cada bloque al contar tecnologías
+CSV_CHUNKSIZE = 100_000
+
+
 class WordCloudGenerator:
     def __init__(self, output_dir: str = "wordclouds"):
         """
@@ -73,47 +84,137 @@ class WordCloudGenerator:
             'forest': ['#14532d', '#166534', '#15803d', '#16a34a', '#22c55e'],
             'default': ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b']
         }
+        
+        # Fuentes para el título y las estadísticas de las imágenes
+        self.fonts = self.load_fonts()
+        
+        # Nubes ya calculadas por frecuencias y configuración, para no repetir su disposición
+        self._layout_cache = {}
+        
+        # Lienzos de composición por tamaño, reutilizados entre imágenes
+        self._canvases = {}
+        
+        # Funciones de color ya creadas por esquema
+        self._color_funcs = {}
+    
+    def load_fonts(self) -> Optional[Dict[str, ImageFont.FreeTypeFont]]:
+        """
+        Cargar las fuentes para componer las imágenes con Pillow.
+        
+        Returns:
+            Diccionario con las fuentes del título y de las estadísticas,
+            o None si no se pueden cargar (se usará matplotlib)
+        """
+        try:
+            return {
+                'title': ImageFont.truetype(FONT_PATH, 36),
+                'stats': ImageFont.truetype(FONT_PATH, 20)
+            }
+        except OSError as e:
+            logger.warning("No se pudo cargar la fuente %s, se usará matplotlib: %s", FONT_PATH, e)
+            return None
     
-    def load_csv_data(self, csv_file: str) -> pd.DataFrame:
+    def load_frequencies(self, csv_file: str) -> pd.Series:
         """
-        Cargar datos desde archivo CSV.
+        Obtener las frecuencias de tecnologías, reutilizando las de la ejecución
+        anterior si el CSV no ha cambiado (misma ruta, fecha de modificación y tamaño).
         
         Args:
             csv_file: Ruta del archivo CSV
             
         Returns:
-            DataFrame con los datos cargados
+            Serie con frecuencias de tecnologías, ordenada de mayor a menor
         """
-        if not os.path.exists(csv_file):
-            raise FileNotFoundError(f"Archivo CSV no encontrado: {csv_file}")
+        try:
+            stat = os.stat(csv_file)
+        except OSError:
+            return self.stream_counts(csv_file)
+        
+        cache_path = self.output_dir / ".freq_cache.json"
+        key = {
+            'csv': str(Path(csv_file).resolve()),
+            'mtime': stat.st_mtime_ns,
+            'size': stat.st_size
+        }
         
         try:
-            df = pd.read_csv(csv_file, encoding='utf-8')
-            logger.info(f"CSV cargado: {len(df)} filas")
-            
-            # Verificar columnas esperadas
-            if 'Tecnologia_Encontrada' not in df.columns:
-                raise ValueError("El CSV debe tener una columna 'Tecnologia_Encontrada'")
-            
-            return df
-            
-        except Exception as e:
-            logger.error(f"Error cargando CSV: {e}")
-            raise
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+            if cached.get('key') == key:
+                tech_counts = pd.Series(cached['frequencies'], dtype='int64')
+                logger.info("Frecuencias leídas de la caché: %s", cache_path)
+                logger.info("Tecnologías únicas encontradas: %d", len(tech_counts))
+                return tech_counts
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.debug("Error leyendo la caché %s: %s", cache_path, e)
+        
+        tech_counts = self.stream_counts(csv_file)
+        
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps({'key': key, 'frequencies': tech_counts.to_dict()},
+                                           ensure_ascii=False), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug("Error guardando la caché %s: %s", cache_path, e)
+        
+        return tech_counts
     
-    def count_technologies(self, df: pd.DataFrame) -> Counter:
+    def stream_counts(self, csv_file: str) -> pd.Series:
         """
-        Contar frecuencia de tecnologías.
+        Contar frecuencia de tecnologías leyendo el CSV por bloques.
+        
+        Solo se necesitan los recuentos, así que el CSV nunca se carga entero:
+        cada bloque se cuenta y se acumula.
         
         Args:
-            df: DataFrame con los datos
+            csv_file: Ruta del archivo CSV
             
         Returns:
-            Counter con frecuencias de tecnologías
+            Serie con frecuencias de tecnologías, ordenada de mayor a menor
         """
-        tech_counts = Counter(df['Tecnologia_Encontrada'].str.lower())
-        logger.info(f"Tecnologías únicas encontradas: {len(tech_counts)}")
-        logger.info(f"Total de menciones: {sum(tech_counts.values())}")
+        # Abrir el archivo sirve también para comprobar que existe
+        try:
+            csv_handle = Path(csv_file).open('rb')
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Archivo CSV no encontrado: {csv_file}") from None
+        
+        tech_counts = pd.Series(dtype='int64')
+        rows = 0
+        
+        try:
+            # Solo se usa la columna de tecnologías; como categoría los nombres repetidos se guardan una vez
+            with csv_handle, pd.read_csv(csv_handle, encoding='utf-8', engine='c',
+                                         usecols=['Tecnologia_Encontrada'],
+                                         dtype={'Tecnologia_Encontrada': 'category'},
+                                         chunksize=CSV_CHUNKSIZE) as chunks:
+                for chunk in chunks:
+                    rows += len(chunk)
+                    technologies = chunk['Tecnologia_Encontrada']
+                    # Contar por categoría y pasar a minúsculas solo los nombres distintos,
+                    # colocados en orden de aparición
+                    codes = technologies.cat.codes
+                    first_seen = pd.unique(codes[codes >= 0])
+                    chunk_counts = technologies.value_counts(sort=False).iloc[first_seen]
+                    chunk_counts.index = chunk_counts.index.astype(str).str.lower()
+                    # Sumar sin reordenar, para conservar el orden de aparición en los empates
+                    tech_counts = pd.concat([tech_counts, chunk_counts]).groupby(level=0, sort=False).sum()
+            
+        except ValueError as e:
+            logger.error("Error cargando CSV: %s", e)
+            # usecols falla si no existe la columna esperada
+            if 'Tecnologia_Encontrada' in str(e):
+                raise ValueError("El CSV debe tener una columna 'Tecnologia_Encontrada'") from e
+            raise
+        except Exception as e:
+            logger.error("Error cargando CSV: %s", e)
+            raise
+        
+        tech_counts = tech_counts.astype('int64').sort_values(ascending=False, kind='stable')
+        logger.info("CSV cargado: %d filas", rows)
+        logger.info("Tecnologías únicas encontradas: %d", len(tech_counts))
+        logger.info("Total de menciones: %d", tech_counts.sum())
         
         return tech_counts
     
@@ -127,24 +228,23 @@ class WordCloudGenerator:
         Returns:
             Función de color para wordcloud
         """
+        if color_scheme in self._color_funcs:
+            return self._color_funcs[color_scheme]
+        
         if color_scheme in self.color_schemes:
             colors = self.color_schemes[color_scheme]
         else:
             colors = self.color_schemes['default']
         
+        # Color según la frecuencia (font_size): por encima de 60 el más intenso,
+        # hasta 15 el más claro
+        thresholds = (15, 25, 40, 60)
+        palette = (colors[4], colors[3], colors[2], colors[1], colors[0])
+        
         def color_func(word, font_size, position, orientation, random_state=None, **kwargs):
-            # Seleccionar color basado en la frecuencia (font_size)
-            if font_size > 60:
-                return colors[0]  # Más frecuente - color más intenso
-            elif font_size > 40:
-                return colors[1]
-            elif font_size > 25:
-                return colors[2]
-            elif font_size > 15:
-                return colors[3]
-            else:
-                return colors[4]  # Menos frecuente - color más claro
+            return palette[bisect.bisect_left(thresholds, font_size)]
         
+        self._color_funcs[color_scheme] = color_func
         return color_func
     
     def create_wordcloud(self, 
@@ -169,13 +269,19 @@ class WordCloudGenerator:
         if custom_config:
             config.update(custom_config)
         
-        logger.info(f"Generando nube de palabras: {title}")
-        logger.info(f"Esquema de colores: {color_scheme}")
-        logger.info(f"Palabras a incluir: {len(word_frequencies)}")
+        logger.info("Generando nube de palabras: %s", title)
+        logger.info("Esquema de colores: %s", color_scheme)
+        logger.info("Palabras a incluir: %d", len(word_frequencies))
         
         # Crear función de color personalizada
         color_func = self.get_color_function(color_scheme)
         
+        # Si ya se calculó la disposición de estas palabras, solo se cambian los colores
+        key = (frozenset(word_frequencies.items()), frozenset(config.items()))
+        if key in self._layout_cache:
+            logger.info("Reutilizando disposición ya calculada")
+            return self._layout_cache[key].recolor(color_func=color_func)
+        
         # Generar nube de palabras
         wordcloud = WordCloud(
             width=config['width'],
@@ -189,6 +295,7 @@ class WordCloudGenerator:
             color_func=color_func
         ).generate_from_frequencies(word_frequencies)
         
+        self._layout_cache[key] = wordcloud
         return wordcloud
     
     def save_wordcloud(self, 
@@ -196,8 +303,9 @@ class WordCloudGenerator:
                       filename: str, 
                       title: str = "",
                       show_stats: bool = True,
-                      dpi: int = 300,
-                      original_frequencies: Dict[str, int] = None):
+                      dpi: int = 100,
+                      max_frequency: Optional[int] = None,
+                      compress_level: int = 6):
         """
         Guardar nube de palabras como imagen.
         
@@ -206,43 +314,111 @@ class WordCloudGenerator:
             filename: Nombre del archivo (sin extensión)
             title: Título a mostrar en la imagen
             show_stats: Si mostrar estadísticas en la imagen
-            dpi: Resolución de la imagen
-            original_frequencies: Frecuencias originales sin normalizar
+            dpi: Resolución de la imagen si se guarda con matplotlib; con 100 la
+                figura de 16x8 pulgadas coincide con los 1600x800 píxeles de la nube
+            max_frequency: Frecuencia máxima original (sin normalizar) para las estadísticas
+            compress_level: Nivel de compresión PNG (1 es el más rápido, 9 el más pequeño)
         """
-        # Crear figura
-        plt.figure(figsize=(16, 8))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')
-        
-        if title:
-            plt.title(title, fontsize=20, fontweight='bold', pad=20)
+        stats_text = None
         
         # Agregar estadísticas si se solicita
         if show_stats:
             total_words = len([word for word in wordcloud.words_])
             
-            # Usar las frecuencias originales si están disponibles
-            if original_frequencies:
-                max_freq = max(original_frequencies.values()) if original_frequencies else 0
+            # Usar la frecuencia original si está disponible
+            if max_frequency is not None:
+                max_freq = max_frequency
             else:
                 max_freq = max(wordcloud.words_.values()) if wordcloud.words_ else 0
                 
             stats_text = f"Tecnologías únicas: {total_words} | Frecuencia máxima: {max_freq}"
-            plt.figtext(0.5, 0.02, stats_text, ha='center', fontsize=12, style='italic')
         
         # Guardar imagen
         output_path = self.output_dir / f"{filename}.png"
-        plt.savefig(output_path, dpi=dpi, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
         
-        logger.info(f"Nube de palabras guardada: {output_path}")
+        if self.fonts:
+            # Guardar directamente los píxeles de la nube, añadiendo título y estadísticas
+            image = wordcloud.to_image()
+            if title or stats_text:
+                image = self.compose_image(image, title, stats_text)
+            image.save(output_path, format='PNG', compress_level=compress_level)
+        else:
+            self.save_with_matplotlib(wordcloud, output_path, title, stats_text, dpi, compress_level)
+        
+        logger.info("Nube de palabras guardada: %s", output_path)
         return str(output_path)
     
+    def compose_image(self, image: Image.Image, title: str = "", stats_text: Optional[str] = None) -> Image.Image:
+        """
+        Componer la imagen final: título arriba, nube en el centro y estadísticas abajo.
+        
+        Args:
+            image: Imagen de la nube de palabras
+            title: Título a mostrar en la imagen
+            stats_text: Texto de estadísticas a mostrar al pie
+            
+        Returns:
+            Imagen compuesta (el lienzo se reutiliza en la siguiente llamada,
+            así que hay que guardarla antes)
+        """
+        margin = 20
+        title_height = self.fonts['title'].size + 2 * margin if title else margin
+        stats_height = self.fonts['stats'].size + 2 * margin if stats_text else margin
+        size = (image.width + 2 * margin, title_height + image.height + stats_height)
+        
+        canvas = self._canvases.get(size)
+        if canvas is None:
+            canvas = self._canvases[size] = Image.new('RGB', size, 'white')
+        else:
+            canvas.paste('white', (0, 0) + size)
+        canvas.paste(image, (margin, title_height))
+        
+        draw = ImageDraw.Draw(canvas)
+        center = canvas.width / 2
+        if title:
+            draw.text((center, title_height / 2), title, font=self.fonts['title'], fill='black', anchor='mm')
+        if stats_text:
+            draw.text((center, canvas.height - stats_height / 2), stats_text, font=self.fonts['stats'], fill='black', anchor='mm')
+            
+        return canvas
+    
+    def save_with_matplotlib(self, wordcloud: WordCloud, output_path: Path, title: str = "",
+                             stats_text: Optional[str] = None, dpi: int = 100,
+                             compress_level: int = 6):
+        """
+        Guardar nube de palabras con matplotlib, si no se pueden usar las fuentes de Pillow.
+        
+        Args:
+            wordcloud: Objeto WordCloud a guardar
+            output_path: Ruta de la imagen
+            title: Título a mostrar en la imagen
+            stats_text: Texto de estadísticas a mostrar al pie
+            dpi: Resolución de la imagen
+            compress_level: Nivel de compresión PNG
+        """
+        # Crear figura sin pasar por pyplot, para que se libere al terminar
+        fig = Figure(figsize=(16, 8))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.imshow(wordcloud, interpolation='bilinear')
+        ax.axis('off')
+        
+        if title:
+            ax.set_title(title, fontsize=20, fontweight='bold', pad=20)
+        
+        if stats_text:
+            fig.text(0.5, 0.02, stats_text, ha='center', fontsize=12, style='italic')
+        
+        fig.savefig(output_path, dpi=dpi, bbox_inches='tight', 
+                    facecolor='white', edgecolor='none',
+                    pil_kwargs={'compress_level': compress_level})
+        del fig
+    
     def generate_multiple_wordclouds(self, 
                                    word_frequencies: Dict[str, int],
                                    main_title: str = "Tecnologías Informáticas",
-                                   base_filename: str = "wordcloud_tecnologias"):
+                                   base_filename: str = "wordcloud_tecnologias",
+                                   max_frequency: Optional[int] = None):
         """
         Generar múltiples nubes de palabras con diferentes estilos.
         
@@ -250,6 +426,7 @@ class WordCloudGenerator:
             word_frequencies: Diccionario con frecuencias de palabras
             main_title: Título base para personalizar
             base_filename: Nombre base para los archivos
+            max_frequency: Frecuencia máxima, si ya se conoce
             
         Returns:
             Lista de rutas de archivos generados
@@ -280,28 +457,55 @@ class WordCloudGenerator:
             }
         ]
         
+        # Colocar las palabras es lo costoso y solo depende de las frecuencias:
+        # se calcula una vez y para cada estilo solo se cambian los colores
+        try:
+            wordcloud = self.create_wordcloud(
+                word_frequencies, 
+                title=main_title,
+                color_scheme=configurations[0]['color_scheme']
+            )
+        except Exception as e:
+            logger.error("Error generando nube de palabras: %s", e)
+            return generated_files
+        
+        if max_frequency is None:
+            max_frequency = max(word_frequencies.values())
+        
+        # Cada estilo es solo un recoloreado y una codificación PNG rápida:
+        # un pool de procesos costaría más que el trabajo que reparte
         for config in configurations:
             try:
-                wordcloud = self.create_wordcloud(
-                    word_frequencies, 
-                    title=config['title'],
-                    color_scheme=config['color_scheme']
-                )
-                
-                file_path = self.save_wordcloud(
-                    wordcloud, 
-                    config['filename'], 
-                    config['title'],
-                    original_frequencies=word_frequencies
-                )
-                
-                generated_files.append(file_path)
-                
+                generated_files.append(self.render_style(wordcloud, config, max_frequency))
             except Exception as e:
-                logger.error(f"Error generando {config['filename']}: {e}")
+                logger.error("Error generando %s: %s", config['filename'], e)
         
         return generated_files
     
+    def render_style(self, wordcloud: WordCloud, config: Dict[str, str], max_frequency: Optional[int] = None) -> str:
+        """
+        Colorear una nube ya calculada con un estilo y guardarla.
+        
+        Args:
+            wordcloud: Nube de palabras ya calculada
+            config: Configuración del estilo (color_scheme, title y filename)
+            max_frequency: Frecuencia máxima original para las estadísticas
+            
+        Returns:
+            Ruta del archivo generado
+        """
+        logger.info("Aplicando estilo: %s", config['title'])
+        wordcloud.recolor(color_func=self.get_color_function(config['color_scheme']))
+        
+        # Las variantes de estilo se guardan con la compresión más rápida
+        return self.save_wordcloud(
+            wordcloud, 
+            config['filename'], 
+            config['title'],
+            max_frequency=max_frequency,
+            compress_level=1
+        )
+    
     def create_top_technologies_wordcloud(self, 
                                         word_frequencies: Dict[str, int], 
                                         top_n: int = 50,
@@ -319,9 +523,10 @@ class WordCloudGenerator:
         """
         # Obtener top N tecnologías
         counter = Counter(word_frequencies)
-        top_technologies = dict(counter.most_common(top_n))
+        top = counter.most_common(top_n)
+        top_technologies = dict(top)
         
-        logger.info(f"Generando nube con top {top_n} tecnologías")
+        logger.info("Generando nube con top %d tecnologías", top_n)
         
         wordcloud = self.create_wordcloud(
             top_technologies,
@@ -332,7 +537,7 @@ class WordCloudGenerator:
         filename = f"wordcloud_top_{top_n}_tecnologias"
         return self.save_wordcloud(wordcloud, filename, 
                                  f"Top {top_n} Tecnologías Más Mencionadas",
-                                 original_frequencies=top_technologies)
+                                 max_frequency=top[0][1] if top else None)
     
     def generate_summary_report(self, word_frequencies: Dict[str, int]) -> str:
         """
@@ -348,36 +553,46 @@ class WordCloudGenerator:
         
         report_path = self.output_dir / "resumen_tecnologias.txt"
         
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write("RESUMEN DE TECNOLOGÍAS ENCONTRADAS\n")
-            f.write("=" * 50 + "\n\n")
-            
-            f.write(f"📊 ESTADÍSTICAS GENERALES:\n")
-            f.write(f"Total de tecnologías únicas: {len(counter)}\n")
-            f.write(f"Total de menciones: {sum(counter.values())}\n")
-            f.write(f"Promedio de menciones por tecnología: {sum(counter.values()) / len(counter):.1f}\n\n")
-            
-            f.write(f"🏆 TOP 20 TECNOLOGÍAS MÁS MENCIONADAS:\n")
-            f.write("-" * 50 + "\n")
-            for i, (tech, count) in enumerate(counter.most_common(20), 1):
-                percentage = (count / sum(counter.values())) * 100
-                f.write(f"{i:2d}. {tech:25} - {count:3d} menciones ({percentage:4.1f}%)\n")
-            
-            f.write(f"\n📈 DISTRIBUCIÓN POR FRECUENCIA:\n")
-            f.write("-" * 30 + "\n")
-            
-            # Agrupar por rangos de frecuencia
-            freq_ranges = {
-                'Muy frecuentes (>10)': len([c for c in counter.values() if c > 10]),
-                'Frecuentes (5-10)': len([c for c in counter.values() if 5 <= c <= 10]),
-                'Moderadas (2-4)': len([c for c in counter.values() if 2 <= c <= 4]),
-                'Poco frecuentes (1)': len([c for c in counter.values() if c == 1])
-            }
-            
-            for range_name, count in freq_ranges.items():
-                f.write(f"{range_name:20}: {count:3d} tecnologías\n")
+        # Frecuencias como array para calcular totales y rangos sin bucles en Python
+        vals = np.fromiter(counter.values(), dtype=np.int64, count=len(counter))
+        total = int(vals.sum())
+        top20 = counter.most_common(20)
+        
+        # El reporte se compone en memoria y se escribe de una vez
+        parts = []
+        parts.append("RESUMEN DE TECNOLOGÍAS ENCONTRADAS\n")
+        parts.append("=" * 50 + "\n\n")
+        
+        parts.append(f"📊 ESTADÍSTICAS GENERALES:\n")
+        parts.append(f"Total de tecnologías únicas: {len(counter)}\n")
+        parts.append(f"Total de menciones: {total}\n")
+        parts.append(f"Promedio de menciones por tecnología: {total / len(counter):.1f}\n\n")
+        
+        parts.append(f"🏆 TOP 20 TECNOLOGÍAS MÁS MENCIONADAS:\n")
+        parts.append("-" * 50 + "\n")
+        for i, (tech, count) in enumerate(top20, 1):
+            percentage = (count / total) * 100
+            parts.append(f"{i:2d}. {tech:25} - {count:3d} menciones ({percentage:4.1f}%)\n")
+        
+        parts.append(f"\n📈 DISTRIBUCIÓN POR FRECUENCIA:\n")
+        parts.append("-" * 30 + "\n")
+        
+        # Agrupar por rangos de frecuencia: [1], [2-4], [5-10] y [11-...]
+        range_counts, _ = np.histogram(vals, bins=[1, 2, 5, 11, np.iinfo(np.int64).max])
+        freq_ranges = {
+            'Muy frecuentes (>10)': int(range_counts[3]),
+            'Frecuentes (5-10)': int(range_counts[2]),
+            'Moderadas (2-4)': int(range_counts[1]),
+            'Poco frecuentes (1)': int(range_counts[0])
+        }
+        
+        for range_name, count in freq_ranges.items():
+            parts.append(f"{range_name:20}: {count:3d} tecnologías\n")
         
-        logger.info(f"Reporte de resumen guardado: {report_path}")
+        with open(report_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write("".join(parts))
+        
+        logger.info("Reporte de resumen guardado: %s", report_path)
         return str(report_path)
     
     def run(self, csv_file: str, generate_multiple: bool = True, top_n: int = 50, main_title: str = "Tecnologías Informáticas", main_color_scheme: str = "tech_blue") -> Dict:
@@ -394,26 +609,28 @@ class WordCloudGenerator:
         Returns:
             Diccionario con información de archivos generados
         """
-        logger.info(f"Iniciando generación de nubes de palabras desde: {csv_file}")
-        
-        # Cargar datos
-        df = self.load_csv_data(csv_file)
+        logger.info("Iniciando generación de nubes de palabras desde: %s", csv_file)
         
         # Contar tecnologías
-        tech_counts = self.count_technologies(df)
-        word_frequencies = dict(tech_counts)
+        tech_counts = self.load_frequencies(csv_file)
+        word_frequencies = tech_counts.to_dict()
+        # La serie está ordenada de mayor a menor
+        max_frequency = int(tech_counts.iloc[0]) if not tech_counts.empty else None
         
         generated_files = []
         
-        # Generar nube principal con título y esquema de colores personalizados
+        # Generar nube principal con título y esquema de colores personalizados.
+        # No es una copia de uno de los estilos (su título y colores son otros), pero su
+        # disposición queda en caché y los estilos múltiples solo la vuelven a colorear
         wordcloud = self.create_wordcloud(word_frequencies, title=main_title, color_scheme=main_color_scheme)
         main_file = self.save_wordcloud(wordcloud, "wordcloud_tecnologias_principal", main_title, 
-                                      original_frequencies=word_frequencies)
+                                      max_frequency=max_frequency)
         generated_files.append(main_file)
         
         # Generar múltiples estilos si se solicita
         if generate_multiple:
-            multiple_files = self.generate_multiple_wordclouds(word_frequencies, main_title)
+            multiple_files = self.generate_multiple_wordclouds(word_frequencies, main_title,
+                                                              max_frequency=max_frequency)
             generated_files.extend(multiple_files)
         
         # Generar nube con top tecnologías
@@ -423,14 +640,14 @@ class WordCloudGenerator:
         # Generar reporte de resumen
         report_file = self.generate_summary_report(word_frequencies)
         
-        logger.info(f"Generación completada. {len(generated_files)} nubes de palabras creadas.")
+        logger.info("Generación completada. %d nubes de palabras creadas.", len(generated_files))
         
         return {
             'wordcloud_files': generated_files,
             'report_file': report_file,
             'total_technologies': len(tech_counts),
-            'total_mentions': sum(tech_counts.values()),
-            'top_technology': tech_counts.most_common(1)[0] if tech_counts else None
+            'total_mentions': int(tech_counts.sum()),
+            'top_technology': (tech_counts.index[0], int(tech_counts.iloc[0])) if not tech_counts.empty else None
         }
 
 